@@ -8,10 +8,25 @@ This program is distributed in the hope that it will be useful, but WITHOUT ANY
 You should have received a copy of the GNU Affero General Public License along with this program. If not, see <https://www.gnu.org/licenses/>
 """
 
-from typing import Any, Callable, List, Union, Set, Tuple
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Union, Set, Tuple
 from datetime import datetime
 from collections import Counter
-import xml.etree.ElementTree as ET
+from concurrent.futures import Future, ProcessPoolExecutor
+from operator import itemgetter, methodcaller
+from sys import intern
+from types import SimpleNamespace
+import io
+import logging
+import os
+
+# lxml is optional, both backends share the find/iterfind/attrib API used below.
+# The stdlib fallback binds the _elementtree C accelerator by itself (cElementTree is gone since Python 3.9)
+try:
+    from lxml import etree as ET
+    _HAS_LXML: bool = True
+except ImportError:
+    import xml.etree.ElementTree as ET
+    _HAS_LXML: bool = False
 
 from .xodr_dataclasses import (
     XODR_SABCD,
@@ -23,7 +38,6 @@ from .xodr_dataclasses import (
     XODRJunction,
     XODRJunctionConnection,
     XODRJunctionConnectionLaneLink,
-    XODRJunctionController,
     XODRRoad,
     XODRRoadElevationProfile,
     XODRRoadLaneSection,
@@ -36,7 +50,6 @@ from .xodr_dataclasses import (
     XODRRoadLanes,
     XODRRoadLateralProfile,
     XODRRoadLink,
-    XODRRoadLinkPredSucc,
     XODRRoadObjects,
     XODRRoadObjectsElement,
     XODRRoadPlanView,
@@ -54,34 +67,192 @@ from .xodr_dataclasses import (
     XODRUserDataVectorSignal
 )
 
+# shared by all lanes and signals without vector lanes or vector signals
+_EMPTY_USER_DATA = XODRUserData(
+    vectorJunction=None,
+    vectorScene=None,
+    vectorRoad=None
+)
+
+# a line carries no data of its own
+_GEOMETRY_LINE = XODRRoadPlanViewGeometryLine()
+
+# predecessor or successor fields of a road without that link
+_NO_ROAD_LINK: Tuple[None, int, None] = (None, -1, None)
+
+# fetch all mandatory float attributes of a record with a single C level call
+_get_object_floats = itemgetter(
+    "hdg", "length", "pitch", "roll", "s", "t", "width", "zOffset")
+# in field order of XODRRoadPlanViewGeometry, which is built positionally
+_get_geometry_floats = itemgetter("s", "x", "y", "hdg", "length")
+# in field order of XODR_SABCD and XODRRoadLaneSectionLCRLaneWidth, which are built positionally
+_get_sabcd_floats = itemgetter("s", "a", "b", "c", "d")
+_get_width_floats = itemgetter("sOffset", "a", "b", "c", "d")
+# in field order of XODRJunctionConnectionLaneLink
+_get_lane_link_ids = itemgetter("from", "to")
+
+# large maps exceed the default libxml2 limits, ids and whitespace only text nodes are never read.
+# Comments and processing instructions are dropped like the stdlib does, otherwise lxml yields them as children.
+# The text is always fed as utf-8 bytes, so the encoding declared by the document must not be applied
+_PARSER_OPTIONS: Dict[str, Any] = {
+    "huge_tree": True,
+    "collect_ids": False,
+    "remove_blank_text": True,
+    "remove_comments": True,
+    "remove_pis": True,
+    "encoding": "utf-8"
+} if _HAS_LXML else {"encoding": "utf-8"}
+
+# child lookups inside controllers and junctions, lxml evaluates precompiled XPath expressions
+# without reparsing the path on every call
+if _HAS_LXML:
+    _find_controls: Callable[[ET.Element], List[ET.Element]] = ET.XPath("./control")
+    _find_connections: Callable[[ET.Element], List[ET.Element]] = ET.XPath("./connection")
+    _find_lane_links: Callable[[ET.Element], List[ET.Element]] = ET.XPath("./laneLink")
+    # plain str results, smart strings would keep a reference to the (cleared) junction element
+    _find_vector_junction_id: Callable[[ET.Element], str] = ET.XPath(
+        "string(./userData/vectorJunction/@junctionId)", smart_strings=False)
+else:
+    _find_controls: Callable[[ET.Element], List[ET.Element]] = methodcaller(
+        "findall", "./control")
+    _find_connections: Callable[[ET.Element], List[ET.Element]] = methodcaller(
+        "findall", "./connection")
+    _find_lane_links: Callable[[ET.Element], List[ET.Element]] = methodcaller(
+        "findall", "./laneLink")
+
+    def _find_vector_junction_id(junction: ET.Element) -> str:
+        vector_junction: Union[ET.Element, None] = junction.find(
+            path="./userData/vectorJunction")
+        return vector_junction.get("junctionId", "") if vector_junction is not None else ""
+
+# measured with lxml on a 13 MB map with 3000 roads: converting them in place takes 0.8 s, the parent alone spends
+# 0.63 s serialising the roads and unpickling the results. The pool saves at most a fifth of the conversion, which
+# only outweighs starting the workers (up to 0.5 s with spawn/forkserver) on very large maps with enough cores.
+# With the stdlib backend serialising alone costs more than converting, so it never uses the pool
+_PARALLEL_MIN_TEXT_LENGTH = 64 * 1024 * 1024
+_PARALLEL_MIN_CPUS = 4
+_PARALLEL_ROAD_BATCH_SIZE = 64
 
-def map_xml_to_dataclass(xodr_text: str, logger: Any) -> Union[Tuple[OpenDRIVE, List[XODRRoad], Set[int]], None]:
+# stars doesnt care about these lanes..
+_UNWANTED_LANE_TYPES = frozenset(("sidewalk", "none", "shoulder", "median"))
+
+# optional attributes of signals and signal references with their target type
+_OPTIONAL_SIGNAL_FIELDS: Tuple[Tuple[str, Callable[[str], Any]], ...] = (
+    ("country", intern),
+    ("dynamic", intern),
+    ("height", float),
+    ("hOffset", float),
+    ("name", str),
+    ("pitch", float),
+    ("roll", float),
+    ("subtype", int),
+    ("value", float),
+    ("width", float),
+    ("type", int),
+    ("zOffset", float),
+    ("text", str)
+)
+
+
+def map_xml_to_dataclass(xodr_text: str, logger: Any, parallel: bool = True) -> Union[Tuple[OpenDRIVE, List[XODRRoad], Set[int]], None]:
     logger.info("Starting to parse XODR.")
-    root: ET.Element = ET.fromstring(text=xodr_text)
-    if root.tag is None:
-        logger.error("Cannot parse XODR. No valid document root found!")
-        return
+    xodr_header: Union[XODRHeader, None] = None
+    roads: List[XODRRoad] = []
+    controllers: List[XODRController] = []
+    junctions: List[XODRJunction] = []
+    # once a subtree of a kind is invalid, all following subtrees of that kind are skipped
+    failed_tags: Set[str] = set()
+
+    # large maps hand their roads to worker processes in batches while the document is still being read
+    road_batch: List[bytes] = []
+    road_futures: List[Future] = []
+    executor: Union[ProcessPoolExecutor, None] = ProcessPoolExecutor(
+        max_workers=os.cpu_count()) if __use_road_pool(xodr_text=xodr_text, parallel=parallel) else None
+
+    root: Union[ET.Element, None] = None
+    depth: int = 0
+    # lxml refuses str input that carries an encoding declaration, so always hand over bytes.
+    # lxml takes the parser options directly, the stdlib needs them wrapped in a parser
+    xml_events: Iterator[Tuple[str, ET.Element]] = ET.iterparse(
+        io.BytesIO(xodr_text.encode("utf-8")), events=("start", "end"), **_PARSER_OPTIONS
+    ) if _HAS_LXML else ET.iterparse(
+        io.BytesIO(xodr_text.encode("utf-8")), events=("start", "end"), parser=ET.XMLParser(**_PARSER_OPTIONS))
+    try:
+        for event, elem in xml_events:
+            if event == "start":
+                if root is None:
+                    root = elem
+                depth += 1
+                continue
+            depth -= 1
+            # only direct children of the document root are converted, their subtree is complete at this point
+            if depth != 1:
+                continue
+
+            if elem.tag not in failed_tags:
+                if elem.tag == "header":
+                    xodr_header = __find_header_data(
+                        xml_header=elem, logger=logger)
+                elif elem.tag == "road":
+                    if executor is None:
+                        xodr_road: Union[XODRRoad, None] = __get_road(
+                            road=elem, logger=logger)
+                        if xodr_road is None:
+                            failed_tags.add(elem.tag)
+                        else:
+                            roads.append(xodr_road)
+                    else:
+                        road_batch.append(ET.tostring(elem))
+                        if len(road_batch) == _PARALLEL_ROAD_BATCH_SIZE:
+                            road_futures.append(executor.submit(
+                                __parse_road_batch, road_batch))
+                            road_batch = []
+                elif elem.tag == "controller":
+                    xodr_controller: Union[XODRController, None] = __get_controller(
+                        controller=elem, logger=logger)
+                    if xodr_controller is None:
+                        failed_tags.add(elem.tag)
+                    else:
+                        controllers.append(xodr_controller)
+                elif elem.tag == "junction":
+                    xodr_junction: Union[XODRJunction, None] = __get_junction(
+                        junction=elem, logger=logger)
+                    if xodr_junction is None:
+                        failed_tags.add(elem.tag)
+                    else:
+                        junctions.append(xodr_junction)
+            # the dataclasses hold no references into the tree, so the subtree can be freed right away
+            elem.clear()
+            # the emptied elements would otherwise pile up below the root
+            if _HAS_LXML:
+                while elem.getprevious() is not None:
+                    del elem.getparent()[0]
+            else:
+                root.clear()
+
+        if executor is not None:
+            if len(road_batch) != 0:
+                road_futures.append(executor.submit(
+                    __parse_road_batch, road_batch))
+            roads = __collect_road_batches(
+                road_futures=road_futures, logger=logger)
+    finally:
+        if executor is not None:
+            executor.shutdown(cancel_futures=True)
 
-    xodr_header: Union[XODRHeader, None] = __find_header_data(
-        root=root, logger=logger)
     if xodr_header is None:
         logger.error("Cannot parse header from XODR. No valid header found!")
         return
 
-    roads: List[XODRRoad] = __find_list_of_roads(root=root, logger=logger)
     if len(roads) == 0:
         logger.error("Cannot parse roads from XODR. No valid roads found!")
         return
 
-    controllers: List[XODRController] = __find_list_of_controllers(
-        root=root, logger=logger)
     if len(controllers) == 0:
         logger.error(
             "Cannot parse controllers from XODR. No valid controllers found!")
         return
 
-    junctions: List[XODRJunction] = __find_list_of_junctions(
-        root=root, logger=logger)
     if len(junctions) == 0:
         logger.error(
             "Cannot parse junctions from XODR. No valid junctions found!")
@@ -111,56 +282,48 @@ def map_xml_to_dataclass(xodr_text: str, logger: Any) -> Union[Tuple[OpenDRIVE,
     return open_drive_data, filtered_roads, removed_roads
 
 
-# stars doesnt care about these lanes..
 def __filter_unnessecary_lanes(roads: List[XODRRoad]) -> List[XODRRoad]:
-    lane_filtered_roads: List[XODRRoad] = []
+    # the lane sections are filtered in place, so the given list is returned as is
     for road in roads:
         if road.lanes is not None and road.lanes.laneSection is not None:
-            for lane_section in [road.lanes.laneSection.left, road.lanes.laneSection.center, road.lanes.laneSection.right]:
-                if lane_section is not None:
-                    lane_section.lanes = [lane for lane in lane_section.lanes if lane.type.lower(
-                    ) not in ["sidewalk", "none", "shoulder", "median"]]
-        lane_filtered_roads.append(road)
-    return lane_filtered_roads
+            for lane_section in (road.lanes.laneSection.left, road.lanes.laneSection.center, road.lanes.laneSection.right):
+                if lane_section is None:
+                    continue
+                lane_section.lanes = [lane for lane in lane_section.lanes
+                                      if lane.type.lower() not in _UNWANTED_LANE_TYPES]
+    return roads
 
 
 def __filter_unnessecary_roads(roads: List[XODRRoad], logger: Any) -> Tuple[List[XODRRoad], Set[int]]:
     logger.info(
         message="Filtering roads (removing types: sidewalk, none, shoulder, median)")
     filtered_roads: List[XODRRoad] = []
+    kept_road_ids: Set[int] = set()
     for road in roads:
         if road.lanes is not None and road.lanes.laneSection is not None:
-            # we can stop the iteration early and move to the next step
-            # of the outer loop if one condition is met
-            _ = [__apply_filter(filtered_roads=filtered_roads, road=road, lane_section=lane_section)
-                 for lane_section in [road.lanes.laneSection.left, road.lanes.laneSection.center, road.lanes.laneSection.right]
-                 if lane_section is not None and road not in filtered_roads]
-    removed_roads = set(
-        road.id for road in roads if road not in filtered_roads)
+            lane_section: XODRRoadLaneSection = road.lanes.laneSection
+            for lcr in (lane_section.left, lane_section.center, lane_section.right):
+                if lcr is None:
+                    continue
+                # a single lane we are interested in is enough to keep the road
+                if any(lane.type.lower() not in _UNWANTED_LANE_TYPES for lane in lcr.lanes):
+                    filtered_roads.append(road)
+                    kept_road_ids.add(road.id)
+                    break
+    removed_roads: Set[int] = {road.id for road in roads} - kept_road_ids
     removed_road_count: int = len(removed_roads)
     filtered_road_count: int = len(filtered_roads)
     logger.info(message=f"Count(Removed Road)={removed_road_count}")
-    logger.debug(message=f"Removed road ids: [{
-                 ', '.join(str(id) for id in sorted(removed_roads))}]")
+    # sorting and joining the ids is only worth it if the message is emitted at all.
+    # The logger follows the rclpy interface (message keyword), its severities share the values of the logging levels
+    if not hasattr(logger, "is_enabled_for") or logger.is_enabled_for(logging.DEBUG):
+        logger.debug(message=f"Removed road ids: [{
+                     ', '.join(str(id) for id in sorted(removed_roads))}]")
     logger.info(message=f"Count(Filtered Road)={filtered_road_count}")
     return filtered_roads, removed_roads
 
 
-def __apply_filter(filtered_roads: List[XODRRoad], road: XODRRoad, lane_section: XODRRoadLaneSectionLCR) -> None:
-    interested_in_type: Callable[[str], bool] = lambda type: type.lower() not in [
-        "sidewalk", "none", "shoulder", "median"]
-    for lane in lane_section.lanes:
-        if interested_in_type(type=lane.type):
-            filtered_roads.append(road)
-            return
-
-
-def __find_header_data(root: ET.Element, logger: Any) -> Union[XODRHeader, None]:
-    xml_header: Union[ET.Element, None] = root.find(path="./header")
-    if xml_header is None:
-        logger.error("No header subtree found. Exiting!")
-        return None
-
+def __find_header_data(xml_header: ET.Element, logger: Any) -> Union[XODRHeader, None]:
     rev_major: str = xml_header.attrib["revMajor"]
     rev_minor: str = xml_header.attrib["revMinor"]
     version: str = xml_header.attrib["version"]
@@ -200,7 +363,7 @@ def __find_header_data(root: ET.Element, logger: Any) -> Union[XODRHeader, None]
         revMajor=int(rev_major),
         revMinor=int(rev_minor),
         version=int(version),
-        date=datetime.strptime(date, '%Y-%m-%dT%H:%M:%S'),
+        date=datetime.fromisoformat(date),
         north=float(north),
         south=float(south),
         east=float(east),
@@ -213,87 +376,100 @@ def __find_header_data(root: ET.Element, logger: Any) -> Union[XODRHeader, None]
                 program=xml_program,
                 version=xml_version
             ),
-            vectorSignals=[],
-            vectorLanes=[],
             vectorRoad=None
         ),
         name=name
     )
 
 
-def __find_list_of_roads(root: ET.Element, logger: Any) -> List[XODRRoad]:
-    road_list: List[XODRRoad] = []
+def __use_road_pool(xodr_text: str, parallel: bool) -> bool:
+    return parallel and _HAS_LXML and len(xodr_text) >= _PARALLEL_MIN_TEXT_LENGTH and (os.cpu_count() or 1) >= _PARALLEL_MIN_CPUS
 
-    # Fail fast
-    list_of_xml_roads: List[ET.Element] = root.findall(path="./road")
-    if len(list_of_xml_roads) == 0:
-        logger.error("No road subtree found. Exiting!")
-        return road_list
-
-    for road in list_of_xml_roads:
-        name: Union[str, None] = road.attrib["name"]
-        road_id: Union[str, None] = road.attrib["id"]
-        length: Union[str, None] = road.attrib["length"]
-        junction: Union[str, None] = road.attrib["junction"]
-
-        if name is None or road_id is None or length is None or junction is None:
-            logger.error("Invalid controller. Exiting!")
-            return road_list
-
-        xodr_road_link: XODRRoadLink = __get_road_link(road=road)
-
-        xodr_road_type: Union[XODRRoadType, None] = __get_road_type(road=road)
-
-        xodr_road_plan_view: Union[XODRRoadPlanView, None] = __get_road_plan_view(
-            road=road, logger=logger)
-        if xodr_road_plan_view is None:
-            logger.error("Invalid road. Exiting!")
-            return road_list
-
-        xodr_road_elevation_profile: Union[XODRRoadElevationProfile,
-                                           None] = __get_road_elevation_profile(road=road, logger=logger)
-        if xodr_road_elevation_profile is None:
-            logger.error("Invalid road elevation profile. Exiting!")
-            return road_list
-
-        xodr_road_lateral_profile: Union[XODRRoadLateralProfile, None] = __get_road_lateral_profile(
-            road=road, logger=logger)
-        if xodr_road_lateral_profile is None:
-            logger.error("Invalid road lateral profile. Exiting!")
-            return road_list
-
-        xodr_road_lanes: Union[XODRRoadLanes, None] = __get_road_lanes(
-            road=road, logger=logger)
-        if xodr_road_lanes is None:
-            logger.error("Invalid road road lanes. Exiting!")
-            return road_list
-
-        xodr_road_signals: List[XODRRoadSignalReference] = __get_road_signals(
-            road=road, is_reference=False)
-        xodr_road_signal_references: List[XODRRoadSignalReference] = __get_road_signals(
-            road=road, is_reference=True)
-        xodr_road_objects: Union[XODRRoadObjects,
-                                 None] = __get_road_objects(road=road)
-        road_list.append(
-            XODRRoad(
-                elevationProfile=xodr_road_elevation_profile,
-                id=int(road_id),
-                junction=int(junction),
-                lanes=xodr_road_lanes,
-                lateralProfile=xodr_road_lateral_profile,
-                length=float(length),
-                link=xodr_road_link,
-                name=name,
-                objects=xodr_road_objects,
-                planView=xodr_road_plan_view,
-                signalReferences=xodr_road_signal_references,
-                signals=xodr_road_signals,
-                type=xodr_road_type
-            )
-        )
+
+def __collect_road_batches(road_futures: List[Future], logger: Any) -> List[XODRRoad]:
+    road_list: List[XODRRoad] = []
+    for road_future in road_futures:
+        for xodr_road, errors in road_future.result():
+            for error in errors:
+                logger.error(error)
+            if xodr_road is None:
+                # an invalid road ends the conversion like it does for roads converted in place
+                return road_list
+            road_list.append(xodr_road)
     return road_list
 
 
+def __parse_road_batch(road_xmls: List[bytes]) -> List[Tuple[Union[XODRRoad, None], List[str]]]:
+    # the callers logger may not be picklable, so errors are collected and replayed by the parent process
+    parser: ET.XMLParser = ET.XMLParser(**_PARSER_OPTIONS)
+    results: List[Tuple[Union[XODRRoad, None], List[str]]] = []
+    for road_xml in road_xmls:
+        errors: List[str] = []
+        xodr_road: Union[XODRRoad, None] = __get_road(
+            road=ET.fromstring(road_xml, parser=parser), logger=SimpleNamespace(error=errors.append))
+        results.append((xodr_road, errors))
+        if xodr_road is None:
+            break
+    return results
+
+
+def __get_road(road: ET.Element, logger: Any) -> Union[XODRRoad, None]:
+    name: str = road.attrib["name"]
+    road_id: str = road.attrib["id"]
+    length: str = road.attrib["length"]
+    junction: str = road.attrib["junction"]
+
+    xodr_road_link: XODRRoadLink = __get_road_link(road=road)
+
+    xodr_road_type: Union[XODRRoadType, None] = __get_road_type(road=road)
+
+    xodr_road_plan_view: Union[XODRRoadPlanView, None] = __get_road_plan_view(
+        road=road, logger=logger)
+    if xodr_road_plan_view is None:
+        logger.error("Invalid road. Exiting!")
+        return None
+
+    xodr_road_elevation_profile: Union[XODRRoadElevationProfile,
+                                       None] = __get_road_elevation_profile(road=road, logger=logger)
+    if xodr_road_elevation_profile is None:
+        logger.error("Invalid road elevation profile. Exiting!")
+        return None
+
+    xodr_road_lateral_profile: Union[XODRRoadLateralProfile, None] = __get_road_lateral_profile(
+        road=road, logger=logger)
+    if xodr_road_lateral_profile is None:
+        logger.error("Invalid road lateral profile. Exiting!")
+        return None
+
+    xodr_road_lanes: Union[XODRRoadLanes, None] = __get_road_lanes(
+        road=road, logger=logger)
+    if xodr_road_lanes is None:
+        logger.error("Invalid road road lanes. Exiting!")
+        return None
+
+    xodr_road_signals: List[XODRRoadSignalReference] = __get_road_signals(
+        road=road, is_reference=False)
+    xodr_road_signal_references: List[XODRRoadSignalReference] = __get_road_signals(
+        road=road, is_reference=True)
+    xodr_road_objects: Union[XODRRoadObjects,
+                             None] = __get_road_objects(road=road)
+    return XODRRoad(
+        elevationProfile=xodr_road_elevation_profile,
+        id=int(road_id),
+        junction=int(junction),
+        lanes=xodr_road_lanes,
+        lateralProfile=xodr_road_lateral_profile,
+        length=float(length),
+        link=xodr_road_link,
+        name=name,
+        objects=xodr_road_objects,
+        planView=xodr_road_plan_view,
+        signalReferences=xodr_road_signal_references,
+        signals=xodr_road_signals,
+        type=xodr_road_type
+    )
+
+
 def __get_road_objects(road: ET.Element) -> Union[XODRRoadObjects, None]:
     xml_objects: Union[ET.Element, None] = road.find(path="./objects")
     if xml_objects is None:
@@ -301,22 +477,25 @@ def __get_road_objects(road: ET.Element) -> Union[XODRRoadObjects, None]:
 
     xodr_object_elements: List[XODRRoadObjectsElement] = []
 
-    for obj in xml_objects.findall(path="./object"):
+    for obj in xml_objects.iterfind(path="./object"):
+        obj_attrib = obj.attrib
+        hdg, length, pitch, roll, s, t, width, z_offset = map(
+            float, _get_object_floats(obj_attrib))
         xodr_object_elements.append(XODRRoadObjectsElement(
-            hdg=float(obj.attrib["hdg"]),
-            height=float(obj.attrib["height"]
-                         ) if "height" in obj.attrib else None,
-            id=int(obj.attrib["id"]),
-            length=float(obj.attrib["length"]),
-            name=obj.attrib["name"],
-            orientation=obj.attrib["orientation"],
-            pitch=float(obj.attrib["pitch"]),
-            roll=float(obj.attrib["roll"]),
-            s=float(obj.attrib["s"]),
-            t=float(obj.attrib["t"]),
-            type=obj.attrib["type"],
-            width=float(obj.attrib["width"]),
-            zOffset=float(obj.attrib["zOffset"]),
+            hdg=hdg,
+            height=float(obj_attrib["height"]
+                         ) if "height" in obj_attrib else None,
+            id=int(obj_attrib["id"]),
+            length=length,
+            name=obj_attrib["name"],
+            orientation=intern(obj_attrib["orientation"]),
+            pitch=pitch,
+            roll=roll,
+            s=s,
+            t=t,
+            type=intern(obj_attrib["type"]),
+            width=width,
+            zOffset=z_offset,
         ))
     return XODRRoadObjects(elements=xodr_object_elements)
 
@@ -324,40 +503,39 @@ def __get_road_objects(road: ET.Element) -> Union[XODRRoadObjects, None]:
 def __get_road_signals(road: ET.Element, is_reference: bool) -> List[XODRRoadSignalReference]:
     road_signals: List[XODRRoadSignalReference] = []
 
-    xml_signals: List[ET.Element] = road.findall(
-        path="./signals/signal") if not is_reference else road.findall(path="./signals/signalReference")
-    if xml_signals is None or len(xml_signals) == 0:
-        # we just dont have any signals
-        return road_signals
+    # roads without signals simply yield nothing here
+    xml_signals: Iterator[ET.Element] = road.iterfind(
+        path="./signals/signal") if not is_reference else road.iterfind(path="./signals/signalReference")
 
     for signal in xml_signals:
         signal_id: str = signal.attrib["id"]
         s: str = signal.attrib["t"]
         t: str = signal.attrib["s"]
-        orientation: str = signal.attrib["orientation"]
+        orientation: str = intern(signal.attrib["orientation"])
+
+        xml_signal_children: Dict[str, List[ET.Element]] = __index_children(
+            elem=signal)
 
-        xml_user_data: Union[ET.Element, None] = signal.find(path="./userData")
+        xml_user_data: Union[ET.Element,
+                             None] = xml_signal_children.get("userData", [None])[0]
         if xml_user_data is None:
             return road_signals
         xodr_vector_signals: List[XODRUserDataVectorSignal] = []
-        xml_user_data_vector_signals: List[ET.Element] = xml_user_data.findall(
-            "./vectorSignal")
-        if xml_user_data_vector_signals is not None and len(xml_user_data_vector_signals) != 0:
-            for vector_signal in xml_user_data_vector_signals:
-                if "signalId" in vector_signal.attrib:
-                    xodr_vector_signals.append(XODRUserDataVectorSignal(
-                        signalId=vector_signal.attrib["signalId"]
-                    ))
-
-        xodr_user_data = XODRUserData(
+        for vector_signal in xml_user_data.iterfind("./vectorSignal"):
+            if "signalId" in vector_signal.attrib:
+                xodr_vector_signals.append(XODRUserDataVectorSignal(
+                    signalId=vector_signal.attrib["signalId"]
+                ))
+
+        xodr_user_data: XODRUserData = XODRUserData(
             vectorJunction=None,
-            vectorLanes=[],
             vectorRoad=None,
             vectorScene=None,
             vectorSignals=xodr_vector_signals
-        )
+        ) if len(xodr_vector_signals) != 0 else _EMPTY_USER_DATA
 
-        xml_validity: Union[ET.Element, None] = signal.find(path="./validity")
+        xml_validity: Union[ET.Element,
+                            None] = xml_signal_children.get("validity", [None])[0]
         if xml_validity is None:
             return road_signals
 
@@ -366,54 +544,20 @@ def __get_road_signals(road: ET.Element, is_reference: bool) -> List[XODRRoadSig
             toLane=int(xml_validity.attrib["toLane"])
         )
 
+        signal_attrib = signal.attrib
+        optional_fields: Dict[str, Any] = {
+            key: cast(value) if (value := signal_attrib.get(key)) is not None else None
+            for key, cast in _OPTIONAL_SIGNAL_FIELDS
+        }
         xodr_signal = XODRRoadSignalReference(
             id=int(signal_id),
             s=float(s),
             t=float(t),
             orientation=orientation,
-            country=None,
-            dynamic=None,
-            height=None,
-            hOffset=None,
-            name=None,
-            pitch=None,
-            roll=None,
-            subtype=None,
-            text=None,
-            type=None,
-            value=None,
-            width=None,
-            zOffset=None,
             userData=xodr_user_data,
             validity=xodr_validity,
+            **optional_fields
         )
-
-        if 'country' in signal.attrib:
-            xodr_signal.country = signal.attrib["country"]
-        if 'dynamic' in signal.attrib:
-            xodr_signal.dynamic = signal.attrib["dynamic"]
-        if 'height' in signal.attrib:
-            xodr_signal.height = float(signal.attrib["height"])
-        if 'hOffset' in signal.attrib:
-            xodr_signal.hOffset = float(signal.attrib["hOffset"])
-        if 'name' in signal.attrib:
-            xodr_signal.name = signal.attrib["name"]
-        if 'pitch' in signal.attrib:
-            xodr_signal.pitch = float(signal.attrib["pitch"])
-        if 'roll' in signal.attrib:
-            xodr_signal.roll = float(signal.attrib["roll"])
-        if 'subtype' in signal.attrib:
-            xodr_signal.subtype = int(signal.attrib["subtype"])
-        if 'value' in signal.attrib:
-            xodr_signal.value = float(signal.attrib["value"])
-        if 'width' in signal.attrib:
-            xodr_signal.width = float(signal.attrib["width"])
-        if 'type' in signal.attrib:
-            xodr_signal.type = int(signal.attrib["type"])
-        if 'zOffset' in signal.attrib:
-            xodr_signal.zOffset = float(signal.attrib["zOffset"])
-        if 'text' in signal.attrib:
-            xodr_signal.text = signal.attrib["text"]
         road_signals.append(xodr_signal)
 
     return road_signals
@@ -474,181 +618,127 @@ def __get_road_lane_section(xml_road_lanes: ET.Element, logger: Any) -> Union[XO
 
 def __get_lane_section_lane_info(lane: ET.Element, logger: Any) -> Union[XODRRoadLaneSectionLCR, None]:
     xodr_lanes: List[XODRRoadLaneSectionLCRLane] = []
-    xml_lanes: List[ET.Element] = lane.findall(path="./lane")
-
-    if xml_lanes is not None and len(xml_lanes) != 0:
-        for lcr_lane in xml_lanes:
-            lane_id: str = lcr_lane.attrib["id"]
-            lane_type: str = lcr_lane.attrib["type"]
-            level: str = lcr_lane.attrib["level"]
-
-            xml_user_data: Union[ET.Element,
-                                 None] = lcr_lane.find(path="./userData")
-            if xml_user_data is None:
-                logger.error("No lane user data found. Exiting!")
-                return None
-            xml_user_data_vector_lanes: List[ET.Element] = xml_user_data.findall(
-                path="./vectorLanes")
-            xodr_vector_lanes: List[XODRUserDataVectorLane] = []
-            if xml_user_data_vector_lanes is not None and len(xml_user_data_vector_lanes) != 0:
-                for elem in xml_user_data_vector_lanes:
-                    vector_lane = XODRUserDataVectorLane(
-                        sOffset=float(elem.attrib["sOffset"]),
-                        laneId=elem.attrib["laneId"],
-                        travelDir=elem.attrib["travelDir"]
-                    )
-                    xodr_vector_lanes.append(vector_lane)
-            xodr_user_data = XODRUserData(
-                vectorJunction=None,
-                vectorLanes=xodr_vector_lanes,
-                vectorRoad=None,
-                vectorScene=None,
-                vectorSignals=[]
-            )
-            xodr_widths: List[XODRRoadLaneSectionLCRLaneWidth] = []
-            xml_widths: List[ET.Element] = lcr_lane.findall(path="./width")
-            if xml_widths is not None and len(xml_widths) != 0:
-                for elem in xml_widths:
-                    xodr_widths.append(
-                        XODRRoadLaneSectionLCRLaneWidth(
-                            sOffset=float(elem.attrib["sOffset"]),
-                            a=float(elem.attrib["a"]),
-                            b=float(elem.attrib["b"]),
-                            c=float(elem.attrib["c"]),
-                            d=float(elem.attrib["d"])
-                        )
-                    )
-
-            road_marks: List[XODRRoadLaneSectionLCRLaneRoadMark] = []
-            xml_marks: List[ET.Element] = lcr_lane.findall(path="./roadMark")
-            if xml_marks is not None and len(xml_marks) != 0:
-                for elem in xml_marks:
-                    xodr_mark = XODRRoadLaneSectionLCRLaneRoadMark(
-                        sOffset=float(elem.attrib["sOffset"]),
-                        type=elem.attrib["type"],
-                        material=elem.attrib["material"],
-                        color=None,
-                        laneChange=elem.attrib["laneChange"],
-                        width=None
-                    )
-                    if 'color' in elem.attrib:
-                        xodr_mark.color = elem.attrib["color"]
-                    if 'width' in elem.attrib:
-                        xodr_mark.width = float(elem.attrib["width"])
-                    road_marks.append(xodr_mark)
-
-            xml_link: Union[ET.Element, None] = lcr_lane.find(path="./link")
-            lane_link = XODRRoadLaneSectionLCRLaneLink(
-                predecessor=None,
-                successor=None
+    for lcr_lane in lane.iterfind(path="./lane"):
+        lane_id: str = lcr_lane.attrib["id"]
+        lane_type: str = lcr_lane.attrib["type"]
+        level: str = lcr_lane.attrib["level"]
+        xml_lane_children: Dict[str, List[ET.Element]] = __index_children(
+            elem=lcr_lane)
+
+        xml_user_data: Union[ET.Element,
+                             None] = xml_lane_children.get("userData", [None])[0]
+        if xml_user_data is None:
+            logger.error("No lane user data found. Exiting!")
+            return None
+        xodr_vector_lanes: List[XODRUserDataVectorLane] = [
+            XODRUserDataVectorLane(
+                sOffset=float(elem.attrib["sOffset"]),
+                laneId=elem.attrib["laneId"],
+                travelDir=elem.attrib["travelDir"]
             )
-            if xml_link is not None:
-                xml_link_pred: Union[ET.Element, None] = xml_link.find(
-                    path="./predecessor")
-                if xml_link_pred is not None:
-                    pred_id: int = int(xml_link_pred.attrib["id"])
-                    lane_link.predecessor = XODRRoadLaneSectionLCRLaneLinkPredecessorSuccessor(
-                        id=pred_id)
-                xml_link_succ: Union[ET.Element, None] = xml_link.find(
-                    path="./successor")
-                if xml_link_succ is not None:
-                    succ_id: int = int(xml_link_succ.attrib["id"])
-                    lane_link.successor = XODRRoadLaneSectionLCRLaneLinkPredecessorSuccessor(
-                        id=succ_id)
-
-            xodr_lcr_lane: XODRRoadLaneSectionLCRLane = XODRRoadLaneSectionLCRLane(
-                id=int(lane_id),
-                type=lane_type,
-                level=bool(level),
-                userData=xodr_user_data,
-                roadMarks=road_marks,
-                widths=xodr_widths,
-                link=lane_link
+            for elem in xml_user_data.iterfind(path="./vectorLanes")
+        ]
+        xodr_user_data: XODRUserData = XODRUserData(
+            vectorJunction=None,
+            vectorLanes=xodr_vector_lanes,
+            vectorRoad=None,
+            vectorScene=None
+        ) if len(xodr_vector_lanes) != 0 else _EMPTY_USER_DATA
+        xodr_widths: List[XODRRoadLaneSectionLCRLaneWidth] = [
+            XODRRoadLaneSectionLCRLaneWidth(
+                *map(float, _get_width_floats(elem.attrib)))
+            for elem in xml_lane_children.get("width", [])
+        ]
+
+        road_marks: List[XODRRoadLaneSectionLCRLaneRoadMark] = []
+        for elem in xml_lane_children.get("roadMark", []):
+            xodr_mark = XODRRoadLaneSectionLCRLaneRoadMark(
+                sOffset=float(elem.attrib["sOffset"]),
+                type=intern(elem.attrib["type"]),
+                material=intern(elem.attrib["material"]),
+                color=None,
+                laneChange=intern(elem.attrib["laneChange"]),
+                width=None
             )
-            xodr_lanes.append(xodr_lcr_lane)
+            if 'color' in elem.attrib:
+                xodr_mark.color = intern(elem.attrib["color"])
+            if 'width' in elem.attrib:
+                xodr_mark.width = float(elem.attrib["width"])
+            road_marks.append(xodr_mark)
+
+        xml_link: Union[ET.Element,
+                        None] = xml_lane_children.get("link", [None])[0]
+        lane_link = XODRRoadLaneSectionLCRLaneLink(
+            predecessor=None,
+            successor=None
+        )
+        if xml_link is not None:
+            xml_link_children: Dict[str, List[ET.Element]] = __index_children(
+                elem=xml_link)
+            xml_link_pred: Union[ET.Element,
+                                 None] = xml_link_children.get("predecessor", [None])[0]
+            if xml_link_pred is not None:
+                pred_id: int = int(xml_link_pred.attrib["id"])
+                lane_link.predecessor = XODRRoadLaneSectionLCRLaneLinkPredecessorSuccessor(
+                    id=pred_id)
+            xml_link_succ: Union[ET.Element,
+                                 None] = xml_link_children.get("successor", [None])[0]
+            if xml_link_succ is not None:
+                succ_id: int = int(xml_link_succ.attrib["id"])
+                lane_link.successor = XODRRoadLaneSectionLCRLaneLinkPredecessorSuccessor(
+                    id=succ_id)
+
+        xodr_lcr_lane: XODRRoadLaneSectionLCRLane = XODRRoadLaneSectionLCRLane(
+            id=int(lane_id),
+            type=intern(lane_type),
+            level=bool(level),
+            userData=xodr_user_data,
+            roadMarks=road_marks,
+            widths=xodr_widths,
+            link=lane_link
+        )
+        xodr_lanes.append(xodr_lcr_lane)
     return XODRRoadLaneSectionLCR(lanes=xodr_lanes)
 
 
 def __get_road_lane_offsets(xml_road_lanes: ET.Element, logger: Any) -> List[XODR_SABCD]:
-    xodr_lane_offsets: List[XODR_SABCD] = []
-    xml_lane_offsets: List[ET.Element] = xml_road_lanes.findall(
-        path="./laneOffset")
-    if xml_lane_offsets is None or len(xml_lane_offsets) == 0:
+    xodr_lane_offsets: List[XODR_SABCD] = __get_sabcd_list(
+        xml_polynomials=xml_road_lanes.iterfind(path="./laneOffset"))
+    if len(xodr_lane_offsets) == 0:
         logger.error("No lane offset found. Exiting!")
-        return xodr_lane_offsets
-
-    for offset in xml_lane_offsets:
-        s: str = offset.attrib["s"]
-        a: str = offset.attrib["a"]
-        b: str = offset.attrib["b"]
-        c: str = offset.attrib["c"]
-        d: str = offset.attrib["d"]
-        xodr_lane_offsets.append(
-            XODR_SABCD(
-                s=float(s),
-                a=float(a),
-                b=float(b),
-                c=float(c),
-                d=float(d)
-            )
-        )
     return xodr_lane_offsets
 
 
 def __get_road_lateral_profile(road: ET.Element, logger: Any) -> Union[XODRRoadLateralProfile, None]:
     xml_road_lateral_profile: Union[ET.Element,
-                                    None] = road.find(path="./elevationProfile")
-    xodr_super_elevations: List[XODR_SABCD] = []
+                                    None] = road.find(path="./lateralProfile")
 
     if xml_road_lateral_profile is None:
-        logger.error("No lateral profile found. Exiting!")
-        return None
+        # the lateral profile is optional, return an empty one
+        return XODRRoadLateralProfile(superelevations=[])
 
-    if xml_road_lateral_profile.find(path="./superelevation") is None:
-        # return an empty lateral profile
-        return XODRRoadLateralProfile(superelevations=xodr_super_elevations)
-
-    # type: ignore # cannot be None here..
-    for elevation in xml_road_lateral_profile.find(path="./superelevation"):
-        s: str = elevation.attrib["s"]
-        a: str = elevation.attrib["a"]
-        b: str = elevation.attrib["b"]
-        c: str = elevation.attrib["c"]
-        d: str = elevation.attrib["d"]
-        xodr_super_elevations.append(XODR_SABCD(
-            s=float(s),
-            a=float(a),
-            b=float(b),
-            c=float(c),
-            d=float(d),
-        ))
-    return XODRRoadLateralProfile(superelevations=xodr_super_elevations)
+    return XODRRoadLateralProfile(superelevations=__get_sabcd_list(
+        xml_polynomials=xml_road_lateral_profile.iterfind(path="./superelevation")))
 
 
 def __get_road_elevation_profile(road: ET.Element, logger: Any) -> Union[XODRRoadElevationProfile, None]:
     xml_road_elevation_profile: Union[ET.Element, None] = road.find(
         path="./elevationProfile")
-    xodr_elevations: List[XODR_SABCD] = []
 
     if xml_road_elevation_profile is None:
         logger.error("No elevation profile found. Exiting!")
         return None
 
-    # type: ignore # cannot be None here..
-    for elevation in xml_road_elevation_profile.find(path="./elevation"):
-        s: str = elevation.attrib["s"]
-        a: str = elevation.attrib["a"]
-        b: str = elevation.attrib["b"]
-        c: str = elevation.attrib["c"]
-        d: str = elevation.attrib["d"]
-        xodr_elevations.append(XODR_SABCD(
-            s=float(s),
-            a=float(a),
-            b=float(b),
-            c=float(c),
-            d=float(d),
-        ))
-    return XODRRoadElevationProfile(elevations=xodr_elevations)
+    return XODRRoadElevationProfile(elevations=__get_sabcd_list(
+        xml_polynomials=xml_road_elevation_profile.iterfind(path="./elevation")))
+
+
+def __get_sabcd_list(xml_polynomials: Iterable[ET.Element]) -> List[XODR_SABCD]:
+    # elevations, superelevations and lane offsets share the same cubic polynomial record
+    return [
+        XODR_SABCD(*map(float, _get_sabcd_floats(xml_polynomial.attrib)))
+        for xml_polynomial in xml_polynomials
+    ]
 
 
 def __get_road_plan_view(road: ET.Element, logger: Any) -> Union[XODRRoadPlanView, None]:
@@ -660,39 +750,23 @@ def __get_road_plan_view(road: ET.Element, logger: Any) -> Union[XODRRoadPlanVie
         return None
 
     for geometry in xml_road_plan_view:
-        xodr_geo: XODRRoadPlanViewGeometry = XODRRoadPlanViewGeometry(
-            s=0.0,
-            x=0.0,
-            y=0.0,
-            hdg=0.0,
-            length=0.0,
-            line=None,
-            arc=None
-        )
+        s, x, y, hdg, length = 0.0, 0.0, 0.0, 0.0, 0.0
         if 's' in geometry.attrib:  # will include all attribs or None at all, so checking for 's' suffices
-            s: str = geometry.attrib["s"]
-            x: str = geometry.attrib["x"]
-            y: str = geometry.attrib["y"]
-            hdg: str = geometry.attrib["hdg"]
-            length: str = geometry.attrib["length"]
-
-            xodr_geo.s = float(s)
-            xodr_geo.x = float(x)
-            xodr_geo.y = float(y)
-            xodr_geo.hdg = float(hdg)
-            xodr_geo.length = float(length)
-        if geometry is not None:
-            lines: Union[ET.Element, None] = geometry.find(path="./line")
-            arcs: Union[ET.Element, None] = geometry.find(path="./arc")
-            if lines is not None and len(lines) != 0:
-                for _ in lines:
-                    xodr_geo.line = XODRRoadPlanViewGeometryLine()
-            if arcs is not None and len(arcs) != 0:
-                for arc in arcs:
-                    curv: str = arc.attrib["curvature"]
-                    xodr_geo.arc = XODRRoadPlanViewGeometryArc(
-                        curvature=float(curv))
-        xodr_geometries.append(xodr_geo)
+            s, x, y, hdg, length = map(
+                float, _get_geometry_floats(geometry.attrib))
+        xodr_line: Union[XODRRoadPlanViewGeometryLine, None] = None
+        xodr_arc: Union[XODRRoadPlanViewGeometryArc, None] = None
+        # a geometry holds exactly one shape element
+        for shape in geometry:
+            if shape.tag == "line":
+                xodr_line = _GEOMETRY_LINE
+                break
+            elif shape.tag == "arc":
+                xodr_arc = XODRRoadPlanViewGeometryArc(
+                    curvature=float(shape.attrib["curvature"]))
+                break
+        xodr_geometries.append(XODRRoadPlanViewGeometry(
+            s, x, y, hdg, length, xodr_line, xodr_arc))
     return XODRRoadPlanView(geometry=xodr_geometries)
 
 
@@ -709,158 +783,99 @@ def __get_road_type(road: ET.Element) -> Union[XODRRoadType, None]:
 
             return XODRRoadType(
                 s=float(s),
-                type=road_type,
+                type=intern(road_type),
                 speed=XODRRoadTypeSpeed(
                     max=int(xml_speed_max),
-                    unit=xml_speed_unit
+                    unit=intern(xml_speed_unit)
                 )
             )
     return None
 
 
 def __get_road_link(road: ET.Element) -> XODRRoadLink:
-    xml_road_link_pred: Union[ET.Element, None] = road.find(
-        path="./link/predecessor")
-    xml_road_link_pred_element_type: str = ""
-    xml_road_link_pred_element_id: str = ""
-    xml_road_link_pred_contact_point: str = ""
-    if xml_road_link_pred is not None:
-        xml_road_link_pred_element_type: str = xml_road_link_pred.attrib["elementType"]
-        xml_road_link_pred_element_id: str = xml_road_link_pred.attrib["elementId"]
-        if 'contactPoint' in xml_road_link_pred.attrib:
-            xml_road_link_pred_contact_point: str = xml_road_link_pred.attrib["contactPoint"]
-
-    xml_road_link_succ: Union[ET.Element, None] = road.find(
-        path="./link/successor")
-    xml_road_link_succ_element_type: str = ""
-    xml_road_link_succ_element_id: str = ""
-    xml_road_link_succ_contact_point: str = ""
-    if xml_road_link_succ is not None:
-        xml_road_link_succ_element_type: str = xml_road_link_succ.attrib["elementType"]
-        xml_road_link_succ_element_id: str = xml_road_link_succ.attrib["elementId"]
-        if 'contactPoint' in xml_road_link_succ.attrib:
-            xml_road_link_pred_contact_point: str = xml_road_link_succ.attrib["contactPoint"]
-
-    xodr_road_link: XODRRoadLink = XODRRoadLink(
-        predecessor=XODRRoadLinkPredSucc(
-            elementType=xml_road_link_pred_element_type,
-            elementId=int(xml_road_link_pred_element_id),
-            contactPoint=xml_road_link_pred_contact_point if xml_road_link_pred_contact_point != "" else None
-        ) if xml_road_link_pred_element_id != "" else None,
-        successor=XODRRoadLinkPredSucc(
-            elementType=xml_road_link_succ_element_type,
-            elementId=int(xml_road_link_succ_element_id),
-            contactPoint=xml_road_link_succ_contact_point if xml_road_link_succ_contact_point != "" else None
-        ) if xml_road_link_succ_element_id != "" else None
+    return XODRRoadLink(
+        *__get_road_link_pred_succ(
+            xml_road_link=road.find(path="./link/predecessor")),
+        *__get_road_link_pred_succ(
+            xml_road_link=road.find(path="./link/successor"))
     )
-    return xodr_road_link
-
-
-def __find_list_of_controllers(root: ET.Element, logger: Any) -> List[XODRController]:
-    controller_list: List[XODRController] = []
-
-    # Fail fast
-    list_of_xml_controllers: List[ET.Element] = root.findall(
-        path="./controller")
-    if len(list_of_xml_controllers) == 0:
-        logger.error("No controller subtree found. Exiting!")
-        return controller_list
-
-    for controller in list_of_xml_controllers:
-        name: Union[str, None] = controller.attrib["name"]
-        controller_id: Union[str, None] = controller.attrib["id"]
-        sequence: Union[str, None] = controller.attrib["sequence"]
-        if name is None or controller_id is None or sequence is None:
-            logger.error("Invalid controller. Exiting!")
-            return controller_list
-
-        control_list: List[XODRControllerControl] = []
-        for control in controller.findall(path="./control"):
-            signal_id: Union[str, None] = control.attrib["signalId"]
-            control_type: Union[str, None] = control.attrib["type"]
-            if signal_id is None or control_type is None:
-                logger.error("Invalid control. Exiting!")
-                return controller_list
-
-            dataclass_control: XODRControllerControl = XODRControllerControl(
-                signalId=int(signal_id),
-                type=control_type
-            )
-            control_list.append(dataclass_control)
-        xodr_controller = XODRController(
-            id=int(controller_id),
-            name=name,
-            sequence=int(sequence),
-            controls=control_list
+
+
+def __get_road_link_pred_succ(xml_road_link: Union[ET.Element, None]) -> Tuple[Union[str, None], int, Union[str, None]]:
+    # element type, element id and contact point in field order of XODRRoadLink
+    if xml_road_link is None:
+        return _NO_ROAD_LINK
+    # a link without elementId counts as absent, an empty contactPoint as unset
+    element_id: Union[str, None] = xml_road_link.get("elementId")
+    if not element_id:
+        return _NO_ROAD_LINK
+    contact_point: Union[str, None] = xml_road_link.get("contactPoint") or None
+    return (
+        intern(xml_road_link.attrib["elementType"]),
+        int(element_id),
+        intern(contact_point) if contact_point is not None else None
+    )
+
+
+def __get_controller(controller: ET.Element, logger: Any) -> Union[XODRController, None]:
+    # required attributes are read via attrib[], a missing or malformed one fails the whole controller
+    try:
+        return XODRController(
+            id=int(controller.attrib["id"]),
+            name=controller.attrib["name"],
+            sequence=int(controller.attrib["sequence"]),
+            controls=[
+                XODRControllerControl(
+                    int(control.attrib["signalId"]), intern(control.attrib["type"]))
+                for control in _find_controls(controller)
+            ]
         )
-        controller_list.append(xodr_controller)
-    return controller_list
-
-
-def __find_list_of_junctions(root: ET.Element, logger: Any) -> List[XODRJunction]:
-    junction_list: List[XODRJunction] = []
-
-    # Fail fast
-    list_of_xml_junctions: List[ET.Element] = root.findall(path="./junction")
-    if len(list_of_xml_junctions) == 0:
-        logger.error("No junction subtree found. Exiting!")
-        return junction_list
-
-    for junction in list_of_xml_junctions:
-        junction_id: Union[str, None] = junction.attrib["id"]
-        junction_name: Union[str, None] = junction.attrib["name"]
-        if junction_id is None or junction_name is None:
-            logger.error("Invalid junction. Exiting!")
-            return junction_list
-
-        list_of_connections: List[XODRJunctionConnection] = []
-        list_of_controllers: List[XODRJunctionController] = []
-        for connection in junction.findall(path="./connection"):
-            list_of_lanelinks: List[XODRJunctionConnectionLaneLink] = []
-            for lanelink in connection.findall(path="./laneLink"):
-                _from: str = lanelink.attrib["from"]
-                _to: str = lanelink.attrib["to"]
-                if _from is None or _to is None:
-                    logger.error("Invalid Lanelink. Exiting!")
-                    return junction_list
-
-                ll = XODRJunctionConnectionLaneLink(
-                    fromId=int(_from), toId=int(_to))
-                list_of_lanelinks.append(ll)
-            connection_id: Union[str, None] = connection.attrib["id"]
-            incoming_road: Union[str, None] = connection.attrib["incomingRoad"]
-            connecting_road: Union[str,
-                                   None] = connection.attrib["connectingRoad"]
-            contact_point: Union[str, None] = connection.attrib["contactPoint"]
-            if connection_id is None or incoming_road is None or connecting_road is None or contact_point is None:
-                logger.error("Invalid connection at junction. Exiting!")
-                return junction_list
-
-            junction_connection: XODRJunctionConnection = XODRJunctionConnection(
-                id=int(connection_id),
-                incomingRoad=int(incoming_road),
-                connectingRoad=int(connecting_road),
-                contactPoint=contact_point,
-                laneLinks=list_of_lanelinks
-            )
-            list_of_connections.append(junction_connection)
+    except (KeyError, ValueError) as error:
+        logger.error(f"Invalid controller ({error!r}). Exiting!")
+        return None
+
+
+def __get_junction(junction: ET.Element, logger: Any) -> Union[XODRJunction, None]:
+    # same fail-fast handling as for controllers, covering the connections and their lane links
+    try:
         xodr_junction: XODRJunction = XODRJunction(
-            id=int(junction_id),
-            name=junction_name,
+            id=int(junction.attrib["id"]),
+            name=junction.attrib["name"],
             userData=None,
-            connections=list_of_connections,
-            controllers=list_of_controllers
+            connections=[
+                XODRJunctionConnection(
+                    id=int(connection.attrib["id"]),
+                    incomingRoad=int(connection.attrib["incomingRoad"]),
+                    connectingRoad=int(connection.attrib["connectingRoad"]),
+                    contactPoint=intern(connection.attrib["contactPoint"]),
+                    laneLinks=[
+                        XODRJunctionConnectionLaneLink(
+                            *map(int, _get_lane_link_ids(lanelink.attrib)))
+                        for lanelink in _find_lane_links(connection)
+                    ]
+                )
+                for connection in _find_connections(junction)
+            ],
+            controllers=[]
         )
-        vector_junction: Union[ET.Element, None] = junction.find(
-            path="./userData/vectorJunction")
-        if vector_junction is not None:
-            junction_id = vector_junction.attrib["junctionId"]
-            user_data = XODRUserData(vectorJunction=XODRUserDataVectorJunction(
-                junctionId=junction_id),
-                vectorScene=None,
-                vectorSignals=[],
-                vectorRoad=None
-            )
-            xodr_junction.userData = user_data
-        junction_list.append(xodr_junction)
-    return junction_list
+    except (KeyError, ValueError) as error:
+        logger.error(f"Invalid junction ({error!r}). Exiting!")
+        return None
+    # an empty id means there is no vectorJunction (or it carries no junctionId)
+    vector_junction_id: str = _find_vector_junction_id(junction)
+    if vector_junction_id:
+        xodr_junction.userData = XODRUserData(
+            vectorJunction=XODRUserDataVectorJunction(
+                junctionId=vector_junction_id),
+            vectorScene=None,
+            vectorRoad=None
+        )
+    return xodr_junction
+
+
+def __index_children(elem: ET.Element) -> Dict[str, List[ET.Element]]:
+    # a single pass over the children replaces one scan per find/findall on the same element
+    children: Dict[str, List[ET.Element]] = {}
+    for child in elem:
+        children.setdefault(child.tag, []).append(child)
+    return children
@@ -10,16 +10,16 @@ You should have received a copy of the GNU Affero General Public License along w
 
 import datetime
 from dataclasses import dataclass, field
-from typing import List, Optional
+from typing import List, Optional, Sequence
 
 
-@dataclass
+@dataclass(slots=True)
 class XODRControllerControl:
     signalId: int
     type: str
 
 
-@dataclass
+@dataclass(slots=True)
 class XODRController:
     id: int
     name: str
@@ -27,20 +27,20 @@ class XODRController:
     controls: List[XODRControllerControl] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class XODRJunctionController:
     id: int
     type: int
     sequence: int
 
 
-@dataclass
+@dataclass(slots=True)
 class XODRJunctionConnectionLaneLink:
     fromId: int
     toId: int
 
 
-@dataclass
+@dataclass(slots=True)
 class XODRJunctionConnection:
     id: int
     incomingRoad: int
@@ -50,44 +50,45 @@ class XODRJunctionConnection:
         default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class XODRUserDataVectorJunction:
     junctionId: str
 
 
-@dataclass
+@dataclass(slots=True)
 class XODRUserDataVectorLane:
     sOffset: float
     laneId: str
     travelDir: str
 
 
-@dataclass
+@dataclass(slots=True)
 class XODRUserDataVectorScene:
     program: str
     version: str
 
 
-@dataclass
+@dataclass(slots=True)
 class XODRUserDataVectorSignal:
     signalId: str
 
 
-@dataclass
+@dataclass(slots=True)
 class XODRUserDataVectorRoad:
     corner: str
 
 
-@dataclass
+# frozen, since lanes and signals without user data share a single instance
+@dataclass(frozen=True, slots=True)
 class XODRUserData:
     vectorJunction: Optional[XODRUserDataVectorJunction]
     vectorScene: Optional[XODRUserDataVectorScene]
     vectorRoad: Optional[XODRUserDataVectorRoad]
-    vectorLanes: List[XODRUserDataVectorLane] = field(default_factory=list)
-    vectorSignals: List[XODRUserDataVectorSignal] = field(default_factory=list)
+    vectorLanes: Sequence[XODRUserDataVectorLane] = ()
+    vectorSignals: Sequence[XODRUserDataVectorSignal] = ()
 
 
-@dataclass
+@dataclass(slots=True)
 class XODRJunction:
     id: int
     name: str
@@ -96,12 +97,12 @@ class XODRJunction:
     controllers: List[XODRJunctionController] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class XODRGeoReference:
     text: str
 
 
-@dataclass
+@dataclass(slots=True)
 class XODRHeader:
     revMajor: int
     revMinor: int
@@ -117,43 +118,75 @@ class XODRHeader:
     name: str = field(default="")
 
 
-@dataclass
+@dataclass(slots=True)
 class XODRRoadLinkPredSucc:
     elementType: str
     elementId: int
     contactPoint: Optional[str]
 
 
-@dataclass
+# flat layout instead of two optional XODRRoadLinkPredSucc objects per road, an element id of -1 marks a missing link.
+# predecessor and successor build a new XODRRoadLinkPredSucc on every access, so they compare equal but are never
+# identical (road.link.predecessor is road.link.predecessor is False) and changes to them are not written back
+@dataclass(slots=True)
 class XODRRoadLink:
-    predecessor: Optional[XODRRoadLinkPredSucc]
-    successor: Optional[XODRRoadLinkPredSucc]
-
-
-@dataclass
+    pred_element_type: Optional[str]
+    pred_element_id: int
+    pred_contact_point: Optional[str]
+    succ_element_type: Optional[str]
+    succ_element_id: int
+    succ_contact_point: Optional[str]
+
+    # nested views for existing readers
+    @property
+    def predecessor(self) -> Optional[XODRRoadLinkPredSucc]:
+        if self.pred_element_id == -1:
+            return None
+        # an existing link always carries its element type
+        assert self.pred_element_type is not None
+        return XODRRoadLinkPredSucc(
+            elementType=self.pred_element_type,
+            elementId=self.pred_element_id,
+            contactPoint=self.pred_contact_point
+        )
+
+    @property
+    def successor(self) -> Optional[XODRRoadLinkPredSucc]:
+        if self.succ_element_id == -1:
+            return None
+        assert self.succ_element_type is not None
+        return XODRRoadLinkPredSucc(
+            elementType=self.succ_element_type,
+            elementId=self.succ_element_id,
+            contactPoint=self.succ_contact_point
+        )
+
+
+@dataclass(slots=True)
 class XODRRoadTypeSpeed:
     max: int
     unit: str
 
 
-@dataclass
+@dataclass(slots=True)
 class XODRRoadType:
     s: float
     type: str
     speed: XODRRoadTypeSpeed
 
 
-@dataclass
+# stateless marker, frozen so all line geometries can share one instance
+@dataclass(frozen=True, slots=True)
 class XODRRoadPlanViewGeometryLine:
     pass
 
 
-@dataclass
+@dataclass(slots=True)
 class XODRRoadPlanViewGeometryArc:
     curvature: float
 
 
-@dataclass
+@dataclass(slots=True)
 class XODRRoadPlanViewGeometry:
     s: float
     x: float
@@ -164,7 +197,7 @@ class XODRRoadPlanViewGeometry:
     arc: Optional[XODRRoadPlanViewGeometryArc]
 
 
-@dataclass
+@dataclass(slots=True)
 class XODR_SABCD:
     s: float
     a: float
@@ -173,22 +206,22 @@ class XODR_SABCD:
     d: float
 
 
-@dataclass
+@dataclass(slots=True)
 class XODRRoadElevationProfile:
     elevations: List[XODR_SABCD] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class XODRRoadLateralProfile:
     superelevations: List[XODR_SABCD] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class XODRRoadPlanView:
     geometry: List[XODRRoadPlanViewGeometry] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class XODRRoadLaneSectionLCRLaneWidth:
     sOffset: float
     a: float
@@ -197,7 +230,7 @@ class XODRRoadLaneSectionLCRLaneWidth:
     d: float
 
 
-@dataclass
+@dataclass(slots=True)
 class XODRRoadLaneSectionLCRLaneRoadMark:
     sOffset: float
     type: str
@@ -207,18 +240,18 @@ class XODRRoadLaneSectionLCRLaneRoadMark:
     width: Optional[float]
 
 
-@dataclass
+@dataclass(slots=True)
 class XODRRoadLaneSectionLCRLaneLinkPredecessorSuccessor:
     id: int
 
 
-@dataclass
+@dataclass(slots=True)
 class XODRRoadLaneSectionLCRLaneLink:
     predecessor: Optional[XODRRoadLaneSectionLCRLaneLinkPredecessorSuccessor]
     successor: Optional[XODRRoadLaneSectionLCRLaneLinkPredecessorSuccessor]
 
 
-@dataclass
+@dataclass(slots=True)
 class XODRRoadLaneSectionLCRLane:
     id: int
     type: str
@@ -230,12 +263,12 @@ class XODRRoadLaneSectionLCRLane:
         default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class XODRRoadLaneSectionLCR:
     lanes: List[XODRRoadLaneSectionLCRLane] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class XODRRoadLaneSection:
     s: float
     left: Optional[XODRRoadLaneSectionLCR]
@@ -243,19 +276,19 @@ class XODRRoadLaneSection:
     right: Optional[XODRRoadLaneSectionLCR]
 
 
-@dataclass
+@dataclass(slots=True)
 class XODRRoadLanes:
     laneSection: XODRRoadLaneSection
     laneOffset: List[XODR_SABCD] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class XODRRoadSignalValidity:
     fromLane: int
     toLane: int
 
 
-@dataclass
+@dataclass(slots=True)
 class XODRRoadSignalReference:
     name: Optional[str]
     id: int
@@ -278,7 +311,7 @@ class XODRRoadSignalReference:
     text: Optional[str]
 
 
-@dataclass
+@dataclass(slots=True)
 class XODRRoadObjectsElement:
     id: int
     name: str
@@ -295,12 +328,12 @@ class XODRRoadObjectsElement:
     length: float
 
 
-@dataclass
+@dataclass(slots=True)
 class XODRRoadObjects:
     elements: List[XODRRoadObjectsElement] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(slots=True)
 class XODRRoad:
     name: str
     length: float
@@ -318,7 +351,7 @@ class XODRRoad:
         default_factory=list)
 
 
-@dataclass(eq=True, frozen=True)
+@dataclass(eq=True, frozen=True, slots=True)
 class OpenDRIVE:
     header: XODRHeader
     roads: List[XODRRoad] = field(default_factory=list)
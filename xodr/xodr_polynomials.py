@@ -0,0 +1,96 @@
+"""
+Copyright (C) 2024 Valentin Rusche
+
+This program is free software: you can redistribute it and/or modify it under the terms of the GNU Affero General Public License as published by the Free Software Foundation, either version 3 of the License, or any later version.
+
+This program is distributed in the hope that it will be useful, but WITHOUT ANY WARRANTY; without even the implied warranty of MERCHANTABILITY or FITNESS FOR A PARTICULAR PURPOSE. See the GNU Affero General Public License for more details.
+
+You should have received a copy of the GNU Affero General Public License along with this program. If not, see <https://www.gnu.org/licenses/>
+"""
+
+# numpy is only needed by consumers that evaluate the polynomials, the parser itself does not import this module
+from dataclasses import dataclass
+from typing import Sequence, Union
+
+import numpy as np
+
+try:
+    from numba import njit
+except ImportError:
+    # without numba the evaluation runs as plain vectorized NumPy
+    def njit(*args, **kwargs):
+        return lambda function: function
+
+from .xodr_dataclasses import XODR_SABCD, XODRRoadLaneSectionLCRLaneWidth
+
+
+# one record per polynomial segment, the fields can be used as columns via data["s"] etc.
+SABCD_DTYPE = np.dtype([
+    ("s", np.float64),
+    ("a", np.float64),
+    ("b", np.float64),
+    ("c", np.float64),
+    ("d", np.float64)
+])
+
+
+# the generated __eq__ would compare the arrays elementwise and fail on their truth value, instances compare by identity
+@dataclass(slots=True, eq=False)
+class XODR_SABCD_Array:
+    # structured array of SABCD_DTYPE records
+    data: np.ndarray
+
+    @property
+    def s(self) -> np.ndarray:
+        return self.data["s"]
+
+    @property
+    def a(self) -> np.ndarray:
+        return self.data["a"]
+
+    @property
+    def b(self) -> np.ndarray:
+        return self.data["b"]
+
+    @property
+    def c(self) -> np.ndarray:
+        return self.data["c"]
+
+    @property
+    def d(self) -> np.ndarray:
+        return self.data["d"]
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+
+def sabcd_to_array(polynomials: Sequence[XODR_SABCD]) -> XODR_SABCD_Array:
+    return XODR_SABCD_Array(data=np.array([(p.s, p.a, p.b, p.c, p.d) for p in polynomials], dtype=SABCD_DTYPE))
+
+
+def widths_to_array(widths: Sequence[XODRRoadLaneSectionLCRLaneWidth]) -> XODR_SABCD_Array:
+    # the s field holds the sOffset relative to the lane section
+    return XODR_SABCD_Array(data=np.array([(w.sOffset, w.a, w.b, w.c, w.d) for w in widths], dtype=SABCD_DTYPE))
+
+
+def evaluate_sabcd(polynomials: XODR_SABCD_Array, s: Union[float, np.ndarray]) -> Union[float, np.ndarray]:
+    # evaluates a + b*ds + c*ds^2 + d*ds^3 of the segment each s falls into, ds being relative to the segment start
+    if len(polynomials) == 0:
+        # e.g. roads without (super)elevation records, the kernel would index past the empty arrays
+        return np.full(np.shape(s), np.nan) if np.ndim(s) != 0 else np.nan
+    return __eval_cubic(
+        np.ascontiguousarray(polynomials.s),
+        np.ascontiguousarray(polynomials.a),
+        np.ascontiguousarray(polynomials.b),
+        np.ascontiguousarray(polynomials.c),
+        np.ascontiguousarray(polynomials.d),
+        s
+    )
+
+
+@njit(fastmath=True, cache=True)
+def __eval_cubic(s_start, a, b, c, d, s):
+    # positions before the first segment are extrapolated from it
+    i = np.maximum(np.searchsorted(s_start, s, side="right") - 1, 0)
+    ds = s - s_start[i]
+    return a[i] + ds * (b[i] + ds * (c[i] + ds * d[i]))